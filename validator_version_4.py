@@ -1,23 +1,146 @@
+import io
 import os
+import re
+import time
+import pickle
+import hashlib
+import tempfile
 import hcl2
+import asyncio
 import logging
 import subprocess
 import argparse
-from typing import List, Set, Dict, Any
+from importlib import metadata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Set, Dict, Any, Optional, Tuple, Iterator, Sequence
 from dataclasses import dataclass
-import requests
-from urllib.parse import urlparse
-
-# Configure logging with a file handler
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('terraform_validator.log'),
-        logging.StreamHandler()
-    ]
+import aiohttp
+
+try:
+    # aiodns lets aiohttp resolve hostnames asynchronously instead of in a thread pool
+    import aiodns  # noqa: F401
+    HAS_AIODNS = True
+except ImportError:
+    HAS_AIODNS = False
+
+try:
+    # Compiled HCL parser, much faster than python-hcl2's pure-Python Lark grammar
+    from rust_hcl2 import parse as _hcl_parse
+    HAS_FAST_HCL = True
+except ImportError:
+    HAS_FAST_HCL = False
+
+    def _hcl_parse(content: bytes) -> Dict[str, Any]:
+        return hcl2.loads(content.decode())
+
+def _package_version(distribution: str) -> str:
+    """Return an installed distribution's version, or 'unknown' if it can't be found."""
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+# Identifies the HCL parser and its version; parsers (and releases of the same
+# parser) differ in output shape, so cached parse results are keyed on this
+HCL_PARSER_ID = (
+    f"rust_hcl2-{_package_version('rust_hcl2')}" if HAS_FAST_HCL
+    else f"hcl2-{_package_version('python-hcl2')}"
 )
 
+# URL schemes whose module sources are checked over HTTP
+HTTP_SCHEMES = frozenset(('http', 'https'))
+
+# Strings in the configuration that start with an HTTP(S) URL
+URL_PATTERN = re.compile(r'https?://\S+')
+
+# Parsed files are cached here, keyed by a hash of their contents
+PARSE_CACHE_DIR = os.path.expanduser('~/.cache/tf_validator')
+
+# Maximum number of HTTP reachability checks in flight at once
+MAX_CONCURRENT_CHECKS = 16
+
+# HTTP connection pool size and DNS cache lifetime (seconds) for the shared session
+HTTP_POOL_SIZE = 64
+DNS_CACHE_TTL = 300
+
+# Per-request budgets (seconds): connect covers DNS and the TCP/TLS handshake,
+# and total caps the whole request so dead hosts fail fast
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=5.0, connect=2.0, sock_read=3.0)
+
+# Retry transient gateway and connection errors a couple of times with
+# exponential backoff; timeouts are not retried so they stay within HTTP_TIMEOUT
+HTTP_RETRIES = 2
+HTTP_BACKOFF_FACTOR = 0.2
+HTTP_RETRY_STATUSES = frozenset((502, 503, 504))
+
+# Some servers refuse HEAD outright; retry those with a one-byte ranged GET
+HEAD_REJECTED_STATUSES = frozenset((403, 405))
+
+# Default terraform graph walk parallelism: roughly three times the logical cores
+DEFAULT_PARALLELISM = (os.cpu_count() or 1) * 3
+
+# Skip terraform init when it last succeeded within this many seconds
+INIT_CACHE_TTL = 24 * 60 * 60
+
+# Marker file under .terraform/ touched after each successful terraform init
+INIT_MARKER = '.validator-init'
+
+# Provider plugin cache shared across runs, unless TF_PLUGIN_CACHE_DIR is already set
+PLUGIN_CACHE_DIR = os.path.expanduser('~/.terraform.d/plugin-cache')
+
+# Terraform output is streamed line by line; only this many trailing lines
+# per stream are kept for the warning logged when a command fails
+OUTPUT_TAIL_LINES = 200
+# Output is read in chunks of this many bytes; a line longer than
+# OUTPUT_LINE_LIMIT bytes is split rather than buffered without bound
+OUTPUT_CHUNK_SIZE = 64 * 1024
+OUTPUT_LINE_LIMIT = 1024 * 1024
+
+def _unquote(value: str) -> str:
+    """Strip the HCL quotes that newer python-hcl2 releases keep around strings."""
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1]
+    return value
+
+def _parse_tf(file_path: str) -> Dict[str, Any]:
+    """Parse a Terraform file, reusing the cached result if its contents are unchanged.
+
+    Defined at module level so it can run in a worker process.
+    """
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    cache_path = os.path.join(PARSE_CACHE_DIR, f"{HCL_PARSER_ID}-{digest}.pkl")
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, stale or corrupted entries (unpickling can fail in many ways) are all misses
+        pass
+    try:
+        parsed = _hcl_parse(content)
+    except Exception as e:
+        # Parser exceptions (e.g. Lark's UnexpectedToken) can't be pickled back to
+        # the parent process, so pass the message on in a plain exception
+        raise ValueError(str(e)) from None
+    # Caching is best effort: any failure to write the entry just leaves a miss
+    tmp_path = None
+    try:
+        os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+        # Write to a temporary file first so concurrent workers never see a partial entry
+        with tempfile.NamedTemporaryFile('wb', dir=PARSE_CACHE_DIR, delete=False) as f:
+            tmp_path = f.name
+            pickle.dump(parsed, f)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return parsed
+
 def setup_argument_parser() -> argparse.ArgumentParser:
     """Setup command line argument parser"""
     parser = argparse.ArgumentParser(
@@ -36,6 +159,12 @@ def setup_argument_parser() -> argparse.ArgumentParser:
         default='terraform_validator.log',
         help='Path to the log file'
     )
+    parser.add_argument(
+        '--parallelism',
+        type=int,
+        default=DEFAULT_PARALLELISM,
+        help='Number of concurrent operations terraform plan may run'
+    )
     return parser
 
 @dataclass
@@ -46,29 +175,83 @@ class ValidationResult:
     is_valid: bool
 
 class TerraformValidator:
-    def __init__(self, directory: str):
+    def __init__(self, directory: str, parallelism: int = DEFAULT_PARALLELISM):
         if not os.path.exists(directory):
             raise ValueError(f"Directory does not exist: {directory}")
         if not os.path.isdir(directory):
             raise ValueError(f"Path is not a directory: {directory}")
+        if parallelism < 1:
+            raise ValueError(f"Parallelism must be a positive integer: {parallelism}")
         self.directory = directory
+        self.parallelism = parallelism
         self.logger = logging.getLogger(__name__)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.executor: Optional[ProcessPoolExecutor] = None
+        # Reachability results shared across files, plus a lock per URL so
+        # concurrent checks of the same URL collapse onto a single request
+        self._url_cache: Dict[str, bool] = {}
+        self._url_locks: Dict[str, asyncio.Lock] = {}
         self.logger.info(f"Initializing validator for directory: {directory}")
 
-    def run_terraform_fmt(self) -> bool:
+    async def _exec_terraform(self, *args: str, env: Optional[Dict[str, str]] = None) -> Tuple[int, str, str]:
+        """Run a terraform subcommand in the project directory and return its exit code, stdout and stderr."""
+        proc = await asyncio.create_subprocess_exec(
+            'terraform', *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.directory,
+            env=env
+        )
+        stdout_tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+        stderr_tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+        try:
+            # Drain both pipes together so neither can fill up and block terraform
+            await asyncio.gather(
+                self._stream_output(args[0], proc.stdout, stdout_tail),
+                self._stream_output(args[0], proc.stderr, stderr_tail)
+            )
+            returncode = await proc.wait()
+        finally:
+            # Never leave terraform running (and holding its state lock) on errors or cancellation
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+        return returncode, '\n'.join(stdout_tail), '\n'.join(stderr_tail)
+
+    async def _stream_output(self, command: str, stream: asyncio.StreamReader, tail: deque) -> None:
+        """Log a subprocess stream line by line as it arrives, keeping only its tail."""
+        pending = b''
+        while True:
+            chunk = await stream.read(OUTPUT_CHUNK_SIZE)
+            if not chunk:
+                break
+            *raw_lines, pending = (pending + chunk).split(b'\n')
+            if len(pending) >= OUTPUT_LINE_LIMIT:
+                raw_lines.append(pending)
+                pending = b''
+            for raw_line in raw_lines:
+                line = raw_line.decode(errors='replace').rstrip('\r')
+                self.logger.debug("terraform %s: %s", command, line)
+                tail.append(line)
+        if pending:
+            line = pending.decode(errors='replace').rstrip('\r')
+            self.logger.debug("terraform %s: %s", command, line)
+            tail.append(line)
+
+    async def run_terraform_fmt(self) -> bool:
         """Run terraform fmt command to check formatting."""
         try:
             self.logger.info("Running terraform fmt check...")
-            result = subprocess.run(
-                ['terraform', 'fmt', '-check', self.directory],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
+            returncode, stdout, stderr = await self._exec_terraform('fmt', '-check')
+            if returncode == 0:
                 self.logger.info("Terraform formatting check passed")
                 return True
             else:
-                self.logger.warning(f"Terraform formatting issues found:\n{result.stdout}")
+                self.logger.warning(f"Terraform formatting issues found:\n{stdout}")
                 return False
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Error running terraform fmt: {str(e)}")
@@ -80,20 +263,28 @@ class TerraformValidator:
             self.logger.error(f"Unexpected error running terraform fmt: {str(e)}")
             return False
 
-    def run_terraform_init(self) -> bool:
+    async def run_terraform_init(self, tf_paths: Sequence[str] = ()) -> bool:
         """Run terraform init command to initialize the directory."""
+        if self._providers_cached(tf_paths):
+            self.logger.info("Using cached providers, skipping terraform init")
+            return True
+        env = dict(os.environ)
+        env.setdefault('TF_PLUGIN_CACHE_DIR', PLUGIN_CACHE_DIR)
+        try:
+            # Terraform ignores the plugin cache unless the directory already exists
+            os.makedirs(env['TF_PLUGIN_CACHE_DIR'], exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Not using plugin cache {env['TF_PLUGIN_CACHE_DIR']!r}: {str(e)}")
+            del env['TF_PLUGIN_CACHE_DIR']
         try:
             self.logger.info("Running terraform init...")
-            result = subprocess.run(
-                ['terraform', 'init', self.directory],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
+            returncode, stdout, stderr = await self._exec_terraform('init', env=env)
+            if returncode == 0:
                 self.logger.info("Terraform init completed successfully")
+                self._mark_initialized()
                 return True
             else:
-                self.logger.warning(f"Terraform init issues found:\n{result.stderr}")
+                self.logger.warning(f"Terraform init issues found:\n{stderr}")
                 return False
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Error running terraform init: {str(e)}")
@@ -105,20 +296,56 @@ class TerraformValidator:
             self.logger.error(f"Unexpected error running terraform init: {str(e)}")
             return False
 
-    def run_terraform_plan(self) -> bool:
+    def _providers_cached(self, tf_paths: Sequence[str] = ()) -> bool:
+        """Check if terraform init last succeeded within INIT_CACHE_TTL and providers are present.
+
+        The marker is stale once the lock file or any of the given .tf files is
+        newer than it, since new modules or providers need another init.
+        """
+        terraform_dir = os.path.join(self.directory, '.terraform')
+        if not os.path.isdir(os.path.join(terraform_dir, 'providers')):
+            return False
+        try:
+            initialized_at = os.stat(os.path.join(terraform_dir, INIT_MARKER)).st_mtime
+        except OSError:
+            return False
+        if time.time() - initialized_at >= INIT_CACHE_TTL:
+            return False
+        config_paths = [os.path.join(self.directory, '.terraform.lock.hcl'), *tf_paths]
+        for path in config_paths:
+            try:
+                if os.stat(path).st_mtime > initialized_at:
+                    return False
+            except FileNotFoundError:
+                continue
+            except OSError:
+                return False
+        return True
+
+    def _mark_initialized(self) -> None:
+        """Touch the init marker so later runs can skip terraform init."""
+        # The providers directory's own mtime only changes when providers are
+        # added or removed, so it can't tell us when init last ran
+        marker = os.path.join(self.directory, '.terraform', INIT_MARKER)
+        try:
+            with open(marker, 'a'):
+                pass
+            os.utime(marker)
+        except OSError as e:
+            self.logger.warning(f"Could not record terraform init in {marker}: {str(e)}")
+
+    async def run_terraform_plan(self) -> bool:
         """Run terraform plan command to create an execution plan."""
         try:
             self.logger.info("Running terraform plan...")
-            result = subprocess.run(
-                ['terraform', 'plan', self.directory],
-                capture_output=True,
-                text=True
+            returncode, stdout, stderr = await self._exec_terraform(
+                'plan', f'-parallelism={self.parallelism}'
             )
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info("Terraform plan completed successfully")
                 return True
             else:
-                self.logger.warning(f"Terraform plan issues found:\n{result.stderr}")
+                self.logger.warning(f"Terraform plan issues found:\n{stderr}")
                 return False
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Error running terraform plan: {str(e)}")
@@ -130,20 +357,16 @@ class TerraformValidator:
             self.logger.error(f"Unexpected error running terraform plan: {str(e)}")
             return False
 
-    def run_terraform_validate(self) -> bool:
+    async def run_terraform_validate(self) -> bool:
         """Run terraform validate command to check syntax and configuration errors."""
         try:
             self.logger.info("Running terraform validate...")
-            result = subprocess.run(
-                ['terraform', 'validate', self.directory],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
+            returncode, stdout, stderr = await self._exec_terraform('validate')
+            if returncode == 0:
                 self.logger.info("Terraform validation passed")
                 return True
             else:
-                self.logger.warning(f"Terraform validation issues found:\n{result.stdout}")
+                self.logger.warning(f"Terraform validation issues found:\n{stdout}")
                 return False
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Error running terraform validate: {str(e)}")
@@ -155,47 +378,82 @@ class TerraformValidator:
             self.logger.error(f"Unexpected error running terraform validate: {str(e)}")
             return False
 
-    def validate_directory(self) -> List[ValidationResult]:
+    async def validate_directory(self) -> List[ValidationResult]:
         """Validate all Terraform files in the directory."""
-        results = []
-        # Check if directory contains .tf files
-        tf_files = [f for f in os.listdir(self.directory) if f.endswith('.tf')]
-        if not tf_files:
+        # Collect .tf files in a single directory walk
+        tf_paths = list(self.find_terraform_files(self.directory))
+        if not tf_paths:
             self.logger.warning(f"No Terraform files found in {self.directory}")
-            return results
+            return []
 
-        # Run terraform commands
-        if not self.run_terraform_fmt():
+        # Run terraform commands: fmt is independent of init, while
+        # validate and plan both need an initialized directory
+        fmt_ok, init_ok = await asyncio.gather(
+            self.run_terraform_fmt(),
+            self.run_terraform_init(tf_paths)
+        )
+        if not fmt_ok:
             self.logger.warning("Terraform formatting check failed")
-        if not self.run_terraform_init():
+        if not init_ok:
             self.logger.warning("Terraform init failed")
-        if not self.run_terraform_validate():
+        validate_ok, plan_ok = await asyncio.gather(
+            self.run_terraform_validate(),
+            self.run_terraform_plan()
+        )
+        if not validate_ok:
             self.logger.warning("Terraform syntax validation failed")
-        if not self.run_terraform_plan():
+        if not plan_ok:
             self.logger.warning("Terraform plan failed")
 
-        # Validate each .tf file
-        for root, _, files in os.walk(self.directory):
-            for file in files:
-                if file.endswith('.tf'):
-                    file_path = os.path.join(root, file)
-                    results.append(self.validate_file(file_path))
-        return results
+        # Validate each .tf file concurrently, sharing one HTTP session
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_SIZE,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            resolver=aiohttp.AsyncResolver() if HAS_AIODNS else None
+        )
+        # HCL parsing is CPU bound, so it runs in worker processes
+        workers = min(len(tf_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                self.executor = executor
+                self.session = session
+                try:
+                    results = await asyncio.gather(*(self.validate_file(p) for p in tf_paths))
+                finally:
+                    self.session = None
+                    self.executor = None
+        return list(results)
+
+    def find_terraform_files(self, directory: str) -> Iterator[str]:
+        """Recursively yield the paths of .tf files under a directory."""
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            # Skip unreadable or vanished directories, as os.walk does
+            self.logger.warning(f"Skipping directory {directory}: {str(e)}")
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self.find_terraform_files(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name.endswith('.tf'):
+                    yield entry.path
 
-    def validate_file(self, file_path: str) -> ValidationResult:
+    async def validate_file(self, file_path: str) -> ValidationResult:
         """Validate a single Terraform file."""
         self.logger.info(f"Validating file: {file_path}")
         issues = []
         try:
-            parser_data = self.parse_terraform_file(file_path)
+            parser_data = await self.parse_terraform_file(file_path)
 
             # Check module source reachability
-            invalid_sources = self.check_module_sources(parser_data)
+            invalid_sources = await self.check_module_sources(parser_data)
             if invalid_sources:
                 issues.append(f"Invalid or unreachable module sources found: {invalid_sources}")
 
             # Check URL reachability
-            unreachable_urls = self.check_url_reachability(parser_data)
+            unreachable_urls = await self.check_url_reachability(parser_data)
             if unreachable_urls:
                 issues.append(f"Unreachable URLs found: {unreachable_urls}")
 
@@ -212,57 +470,126 @@ class TerraformValidator:
                 is_valid=False
             )
 
-    def check_module_sources(self, parser_data: Dict[str, Any]) -> List[str]:
+    async def check_module_sources(self, parser_data: Dict[str, Any]) -> List[str]:
         """Check if module sources are valid and reachable."""
-        modules = parser_data.get('module', {})
+        modules = parser_data.get('module', [])
+        # python-hcl2 returns a list of {name: config} blocks; older releases a single dict
+        blocks = modules if isinstance(modules, list) else [modules]
         invalid_sources = []
-        for module_name, config in modules.items():
-            source = config.get('source')
+        remote_sources = []
+        # Bind attribute lookups once; this loop can run over many modules
+        add_invalid = invalid_sources.append
+        add_remote = remote_sources.append
+        directory = self.directory
+        path_join = os.path.join
+        path_exists = os.path.exists
+        for module_name, config in (item for block in blocks for item in block.items()):
+            module_name = _unquote(module_name)
+            source = _unquote(config.get('source') or '')
             if source:
-                parsed_url = urlparse(source)
-                if parsed_url.scheme in ['http', 'https']:
-                    # Check if URL is reachable
-                    try:
-                        response = requests.head(source, allow_redirects=True, timeout=5)
-                        if response.status_code >= 400:
-                            invalid_sources.append(f"Module {module_name}: Unreachable source URL {source}")
-                    except requests.RequestException as e:
-                        self.logger.warning(f"Error reaching module source URL {source}: {str(e)}")
-                        invalid_sources.append(f"Module {module_name}: Unreachable source URL {source}")
-                elif parsed_url.scheme == '':
+                # Only the scheme is needed, so skip a full urlparse
+                scheme = source.split('://', 1)[0].lower() if '://' in source else ''
+                if scheme in HTTP_SCHEMES:
+                    # Reachability is checked below, for all remote sources at once
+                    add_remote((module_name, source))
+                elif scheme == '':
                     # Check if local path exists
-                    local_path = os.path.join(self.directory, source)
-                    if not os.path.exists(local_path):
-                        invalid_sources.append(f"Module {module_name}: Local source path does not exist {source}")
+                    local_path = path_join(directory, source)
+                    if not path_exists(local_path):
+                        add_invalid(f"Module {module_name}: Local source path does not exist {source}")
+        reachable = await asyncio.gather(
+            *(self._is_url_reachable(source) for _, source in remote_sources)
+        )
+        for (module_name, source), ok in zip(remote_sources, reachable):
+            if not ok:
+                add_invalid(f"Module {module_name}: Unreachable source URL {source}")
         return invalid_sources
 
-    def check_url_reachability(self, parser_data: Dict[str, Any]) -> List[str]:
+    async def check_url_reachability(self, parser_data: Dict[str, Any]) -> List[str]:
         """Check if URLs in the Terraform configuration are reachable."""
-        urls = self.extract_urls(parser_data)
-        unreachable_urls = []
-        for url in urls:
+        urls = list(dict.fromkeys(self.extract_urls(parser_data)))
+        reachable = await asyncio.gather(*(self._is_url_reachable(url) for url in urls))
+        return [url for url, ok in zip(urls, reachable) if not ok]
+
+    async def _is_url_reachable(self, url: str) -> bool:
+        """Check if a URL answers a HEAD request, reusing earlier results."""
+        if url in self._url_cache:
+            return self._url_cache[url]
+        async with self._url_locks.setdefault(url, asyncio.Lock()):
+            # Another coroutine may have finished the check while we waited
+            if url in self._url_cache:
+                return self._url_cache[url]
             try:
-                response = requests.head(url, allow_redirects=True, timeout=5)
-                if response.status_code >= 400:
-                    unreachable_urls.append(url)
-            except requests.RequestException as e:
+                status = await self._head_status(url)
+                if status in HEAD_REJECTED_STATUSES:
+                    status = await self._range_get_status(url)
+                reachable = status < 400
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 self.logger.warning(f"Error reaching URL {url}: {str(e)}")
-                unreachable_urls.append(url)
-        return unreachable_urls
+                reachable = False
+            self._url_cache[url] = reachable
+            return reachable
+
+    async def _head_status(self, url: str) -> int:
+        """Send a HEAD request, retrying transient failures, and return the status code."""
+        semaphore = self.semaphore
+        head = self.session.head
+        for attempt in range(HTTP_RETRIES + 1):
+            try:
+                async with semaphore:
+                    async with head(
+                        url, allow_redirects=True, timeout=HTTP_TIMEOUT
+                    ) as response:
+                        status = response.status
+            except asyncio.TimeoutError:
+                # aiohttp's timeout errors are also ClientConnectionErrors; never retry them
+                raise
+            except aiohttp.ClientConnectionError:
+                if attempt == HTTP_RETRIES:
+                    raise
+            else:
+                if status not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRIES:
+                    return status
+            await asyncio.sleep(HTTP_BACKOFF_FACTOR * (2 ** attempt))
+
+    async def _range_get_status(self, url: str) -> int:
+        """Request only the first byte of a URL and return the status code."""
+        async with self.semaphore:
+            # The body is never read; leaving the block releases the connection
+            async with self.session.get(
+                url, headers={'Range': 'bytes=0-0'}, allow_redirects=True, timeout=HTTP_TIMEOUT
+            ) as response:
+                return response.status
 
-    def extract_urls(self, parser_data: Dict[str, Any]) -> List[str]:
+    def extract_urls(self, parser_data: Dict[str, Any]) -> Iterator[str]:
         """Extract URLs from the Terraform configuration."""
-        urls = []
-        # Implement logic to extract URLs from the configuration data
-        # This will depend on how URLs are stored in your Terraform files
-        # You might need to recursively search through the data structure
-        return urls
+        # Walk the nested dicts/lists with an explicit stack rather than recursion.
+        # Each entry records whether it sits under a module block, whose source
+        # URLs are already checked by check_module_sources.
+        stack = deque((value, key == 'module') for key, value in parser_data.items())
+        while stack:
+            node, in_module = stack.pop()
+            if isinstance(node, dict):
+                stack.extend(
+                    (value, in_module) for key, value in node.items()
+                    if not (in_module and key == 'source')
+                )
+            elif isinstance(node, list):
+                stack.extend((item, in_module) for item in node)
+            elif isinstance(node, str):
+                node = _unquote(node)
+                # Interpolated URLs are only known at plan time, so they can't be checked
+                if '${' in node:
+                    continue
+                match = URL_PATTERN.match(node)
+                if match:
+                    yield match.group(0)
 
-    def parse_terraform_file(self, file_path: str) -> Dict[str, Any]:
+    async def parse_terraform_file(self, file_path: str) -> Dict[str, Any]:
         """Parse a Terraform file and return its contents as a dictionary."""
         try:
-            with open(file_path, 'r') as f:
-                return hcl2.load(f)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, _parse_tf, file_path)
         except Exception as e:
             self.logger.error(f"Error parsing file {file_path}: {str(e)}")
             raise
@@ -272,34 +599,41 @@ def main():
     parser = setup_argument_parser()
     args = parser.parse_args()
     try:
-        # Update logging configuration with user-specified log file
-        for handler in logging.root.handlers[:]:
-            logging.root.removeHandler(handler)
+        # Configure logging once, with the user-specified log file; force
+        # closes and replaces any handlers left over from an earlier call
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
                 logging.FileHandler(args.log_file),
                 logging.StreamHandler()
-            ]
+            ],
+            force=True
         )
         # Create validator instance with provided path
-        validator = TerraformValidator(args.path)
+        validator = TerraformValidator(args.path, parallelism=args.parallelism)
         # Run validation
-        results = validator.validate_directory()
+        results = asyncio.run(validator.validate_directory())
         # Track overall validation status
         has_errors = False
         # Print results
         print("\nValidation Results:")
         print("==================")
+        # Collect results into one message per level rather than logging each line
+        failed = io.StringIO()
+        passed = io.StringIO()
         for result in results:
             if not result.is_valid:
                 has_errors = True
-                logging.error(f"\nFile: {result.file_path}")
+                failed.write(f"\nFile: {result.file_path}")
                 for issue in result.issues:
-                    logging.error(f"  - {issue}")
+                    failed.write(f"\n  - {issue}")
             else:
-                logging.info(f"File {result.file_path} passed validation")
+                passed.write(f"\nFile {result.file_path} passed validation")
+        if failed.tell():
+            logging.error(failed.getvalue())
+        if passed.tell():
+            logging.info(passed.getvalue())
         # Print summary
         print("\nValidation Summary:")
         print("==================")